@@ -8,34 +8,45 @@ import json
 import uuid
 import threading
 import time
+import socket
 import subprocess
+import functools
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-import requests
+try:
+    import orjson  # C-accelerated; stdlib json is the fallback
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QPushButton, QMessageBox, QLineEdit,
+    QListWidget, QListView, QPushButton, QMessageBox, QLineEdit,
     QLabel, QInputDialog, QMenuBar, QMenu, QFrame, QAction, QSplitter, QSplashScreen,
     QFileDialog
 )
-from PyQt5.QtGui import QIcon, QPixmap, QColor, QPainter
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal, QEventLoop, QPropertyAnimation
+from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import (
+    QTimer, Qt, pyqtSignal, QEvent, QPropertyAnimation, QUrl, QAbstractListModel, QModelIndex
+)
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
-# Audio init
+# Audio init — only infrequent UI clicks and a looping BG track, so favour a larger, underrun-proof
+# buffer over latency, and mix just the channels we use (0 splash, 1 bg, 2 fx).
 import pygame
 try:
-    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=2048)
 except Exception:
     pass
 try:
     pygame.mixer.init()
+    pygame.mixer.set_num_channels(4)
 except Exception:
     pass
 
 # ---------- Constants ----------
 BACKEND_URL = "https://jacinto-server.fly.dev"
 HEARTBEAT_INTERVAL = 5
+SERVER_BOOT_TIMEOUT = 10  # seconds; upper bound on waiting for a local server before launching the client
 HOSTS_DB = "hosts.json"
 LEGACY_HOST_CFG = "host_config.json"
 
@@ -45,7 +56,20 @@ COG_TAG_WAV = "gears-of-war-cog-tag-fixed.wav"
 SPLASH_PNG = "splash.png"
 APP_ICON = "Jacinto.ico"
 
+_THEME_QSS = """
+QWidget { background-color: rgba(18,18,18,200); color: #e0e0e0; font-family: Segoe UI; font-size: 14px; }
+QPushButton { background-color: #2a2a2a; border: 1px solid #3e3e3e; padding: 8px; border-radius: 6px; color: white; }
+QPushButton:hover { background-color: #3a3a3a; border: 1px solid #ff0000; }
+QLineEdit, QLabel { border: 1px solid #3e3e3e; border-radius: 4px; padding: 6px; background-color: #1e1e1e; }
+QListView { background: transparent; border: 1px solid #444; border-radius: 6px; }
+QMenuBar { background-color: #1e1e1e; }
+QMenuBar::item:selected { background-color: #2a2a2a; }
+QMenu { background-color: #1e1e1e; }
+QFrame#central { border: 2px solid #ff0000; border-radius: 12px; }
+"""
+
 # ---------- Utils ----------
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path: str) -> str:
     base_path = getattr(sys, "_MEIPASS", None)
     if base_path:
@@ -56,6 +80,7 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(here, relative_path)
 
 
+@functools.lru_cache(maxsize=None)
 def load_sound(name: str) -> Optional["pygame.mixer.Sound"]:
     path = resource_path(name)
     try:
@@ -66,6 +91,23 @@ def load_sound(name: str) -> Optional["pygame.mixer.Sound"]:
     return None
 
 
+def _read_json(path: str) -> Any:
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(path: str, obj: Any) -> None:
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=2)
+
+
 def choose_exe_path(title: str) -> Optional[str]:
     path, _ = QFileDialog.getOpenFileName(None, title, "", "Executable (*.exe);;All Files (*)")
     if not path:
@@ -119,22 +161,38 @@ class Host:
         )
 
 # ---------- Storage ----------
+# Authoritative in-memory host list, keyed by hosts.json's st_mtime_ns; disk is only the backing store.
+# load_hosts() hands out this list itself, so mutate it in place and persist with save_hosts().
+_hosts_cache: Optional[Tuple[int, List[Host]]] = None
+
+
+def _hosts_mtime() -> Optional[int]:
+    try:
+        return os.stat(HOSTS_DB).st_mtime_ns
+    except OSError:
+        return None
+
 
 def load_hosts() -> List[Host]:
-    if os.path.exists(HOSTS_DB):
+    global _hosts_cache
+    mtime = _hosts_mtime()
+    if mtime is not None and _hosts_cache is not None and _hosts_cache[0] == mtime:
+        return _hosts_cache[1]
+    if mtime is not None:
         try:
-            data = json.load(open(HOSTS_DB, "r"))
+            data = _read_json(HOSTS_DB)
             items: List[Host] = []
             for h in data:
                 if "exe_path" not in h:
                     h["exe_path"] = ""
                 items.append(Host(**h))
+            _hosts_cache = (mtime, items)
             return items
         except Exception:
             pass
     if os.path.exists(LEGACY_HOST_CFG):
         try:
-            legacy = json.load(open(LEGACY_HOST_CFG, "r"))
+            legacy = _read_json(LEGACY_HOST_CFG)
             host = Host(
                 id=str(uuid.uuid4()),
                 name=legacy["name"], public_ip=legacy["public_ip"], local_ip=legacy["local_ip"],
@@ -145,18 +203,48 @@ def load_hosts() -> List[Host]:
                 os.remove(LEGACY_HOST_CFG)
             except OSError:
                 pass
-            return [host]
+            return _hosts_cache[1]
         except Exception:
             pass
     return []
 
 
 def save_hosts(items: List[Host]) -> None:
-    json.dump([asdict(h) for h in items], open(HOSTS_DB, "w"), indent=2)
+    global _hosts_cache
+    _write_json(HOSTS_DB, [asdict(h) for h in items])
+    # Adopt what we just wrote so the next load_hosts() is a stat, not a parse.
+    _hosts_cache = (os.stat(HOSTS_DB).st_mtime_ns, items)
 
 # ---------- UI ----------
+class ServerListModel(QAbstractListModel):
+    """Raw /servers payload behind the Available Servers view; rows are formatted lazily in data()."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[dict] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        s = self._rows[index.row()]
+        return f"{s.get('name', '?')} - {s.get('public_ip', '?')}:{s.get('port', '?')}"
+
+    def set_servers(self, servers: List[dict]) -> None:
+        # One reset instead of a row-inserted signal per server.
+        self.beginResetModel()
+        self._rows = [s for s in servers if isinstance(s, dict)]
+        self.endResetModel()
+
+    def server_at(self, row: int) -> dict:
+        return self._rows[row]
+
+
 class JacintoLobbyBrowser(QWidget):
     hb_color_signal = pyqtSignal(str)
+    launch_client_signal = pyqtSignal(list)
 
     def __init__(self):
         super().__init__()
@@ -165,8 +253,8 @@ class JacintoLobbyBrowser(QWidget):
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
         self.setGeometry(200, 100, 980, 620)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setStyleSheet(self._theme())
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(_THEME_QSS)
 
         self.is_muted = False
         self.click = load_sound(COG_TAG_WAV)
@@ -174,33 +262,43 @@ class JacintoLobbyBrowser(QWidget):
         self.splash_sfx = load_sound(MAD_WORLD_WAV)
         self.bg_ch = pygame.mixer.Channel(1) if pygame.mixer.get_init() else None
         self.fx_ch = pygame.mixer.Channel(2) if pygame.mixer.get_init() else None
+        self._unpause_timer = QTimer(self)
+        self._unpause_timer.setSingleShot(True)
+        self._unpause_timer.timeout.connect(self._unpause_bg)
+
+        self._nam = QNetworkAccessManager(self)
+        self._available_reply: Optional[QNetworkReply] = None
+        self._refresh_pending = False
 
         self.available_timer = QTimer(self)
         self.available_timer.timeout.connect(self._refresh_available)
         self.available_timer.start(5000)
-        self.hb_threads: Dict[str, threading.Event] = {}
+        self._hb_active: Dict[str, Host] = {}
+        self._hb_failures: Dict[str, int] = {}
+        self._hb_bulk = True  # cleared if the backend has no /add_servers route
+        self._hb_replies: Set[QNetworkReply] = set()
+        self._hb_timer = QTimer(self)
+        self._hb_timer.setInterval(HEARTBEAT_INTERVAL * 1000)
+        self._hb_timer.timeout.connect(self._hb_tick)
 
         self.hb_color_signal.connect(self._set_hb_color)
+        self.launch_client_signal.connect(self._launch_client)
 
         self._setup_ui()
         self._refresh_available()
         self._refresh_mine()
 
-    def _theme(self) -> str:
-        return """
-        QWidget { background-color: rgba(18,18,18,200); color: #e0e0e0; font-family: Segoe UI; font-size: 14px; }
-        QPushButton { background-color: #2a2a2a; border: 1px solid #3e3e3e; padding: 8px; border-radius: 6px; color: white; }
-        QPushButton:hover { background-color: #3a3a3a; border: 1px solid #ff0000; }
-        QLineEdit, QLabel { border: 1px solid #3e3e3e; border-radius: 4px; padding: 6px; background-color: #1e1e1e; }
-        QListWidget { background: transparent; border: 1px solid #444; border-radius: 6px; }
-        QMenuBar { background-color: #1e1e1e; }
-        QMenuBar::item:selected { background-color: #2a2a2a; }
-        QMenu { background-color: #1e1e1e; }
-        """
-
     def _setup_ui(self) -> None:
-        layout = QVBoxLayout(self)
-        self.setLayout(layout)
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(4, 4, 4, 4)
+        self.setLayout(outer)
+
+        # Opaque window + a plain stylesheet border on the content frame replaces the translucent,
+        # hand-painted 8-layer glow; no graphics effect, so child updates don't re-render the subtree.
+        central = QFrame(self)
+        central.setObjectName("central")
+        outer.addWidget(central)
+        layout = QVBoxLayout(central)
 
         bar = QMenuBar(self)
         hb = QMenu("Heartbeat", self)
@@ -213,7 +311,7 @@ class JacintoLobbyBrowser(QWidget):
         mute_action.triggered.connect(self.toggle_mute)
         audio.addAction(mute_action)
         bar.addMenu(audio)
-        layout.setMenuBar(bar)
+        outer.setMenuBar(bar)
 
         splitter = QSplitter(Qt.Horizontal)
         left = QVBoxLayout(); right = QVBoxLayout()
@@ -221,7 +319,10 @@ class JacintoLobbyBrowser(QWidget):
         right_box = QWidget(); right_box.setLayout(right)
 
         left.addWidget(QLabel("Available Servers"))
-        self.available_list = QListWidget(); self.available_list.setFrameShape(QFrame.Panel)
+        self.available_model = ServerListModel(self)
+        self.available_list = QListView(); self.available_list.setFrameShape(QFrame.Panel)
+        self.available_list.setModel(self.available_model)
+        self.available_list.setUniformItemSizes(True)
         left.addWidget(self.available_list)
 
         right.addWidget(QLabel("My Servers"))
@@ -257,10 +358,12 @@ class JacintoLobbyBrowser(QWidget):
         if self.bg_ch and self.bg_ch.get_busy():
             self.bg_ch.pause()
         self.fx_ch.play(self.click)
-        t0 = time.time()
-        while self.fx_ch.get_busy() and time.time() - t0 < 1.0:
-            pygame.time.wait(10)
-        if self.bg_ch:
+        # Resume bg once the click has played; restarting the timer keeps rapid clicks from stacking.
+        self._unpause_timer.start(int(self.click.get_length() * 1000) + 20)
+
+    def _unpause_bg(self):
+        # Muting while the click plays must not be undone when the timer fires.
+        if self.bg_ch and not self.is_muted:
             self.bg_ch.unpause()
 
     def toggle_mute(self):
@@ -274,19 +377,51 @@ class JacintoLobbyBrowser(QWidget):
         self.hb_status.setStyleSheet(f"background-color: {color}; border-radius: 10px;")
 
     def _refresh_available(self):
+        # Don't poll while hidden/minimized; showEvent/changeEvent catch up once we're back on screen.
+        if not self.isVisible() or self.isMinimized():
+            self._refresh_pending = True
+            return
+        self._refresh_pending = False
+        # Async GET on Qt's event loop; skip the tick if the previous poll is still in flight.
+        if self._available_reply is not None:
+            return
+        req = QNetworkRequest(QUrl(f"{BACKEND_URL}/servers"))
+        if hasattr(req, "setTransferTimeout"):  # Qt >= 5.15
+            req.setTransferTimeout(3000)
+        reply = self._nam.get(req)
+        reply.finished.connect(lambda: self._on_available_reply(reply))
+        self._available_reply = reply
+
+    def _on_available_reply(self, reply: QNetworkReply):
+        self._available_reply = None
         try:
-            res = requests.get(f"{BACKEND_URL}/servers", timeout=3)
-            self.available_list.clear()
-            for s in res.json():
-                self.available_list.addItem(f"{s['name']} - {s['public_ip']}:{s['port']}")
+            if reply.error() != QNetworkReply.NoError:
+                raise RuntimeError(reply.errorString())
+            servers = json.loads(bytes(reply.readAll()))
+            self.available_model.set_servers(servers)
         except Exception as e:
             print("[Available List Error]", e)
+        finally:
+            reply.deleteLater()
 
     def _refresh_mine(self):
-        self.my_list.clear()
+        rows = []
         for h in load_hosts():
             note = " (EXE set)" if h.exe_path else " (EXE not set)"
-            self.my_list.addItem(f"{h.name} - {h.public_ip}:{h.port} (map={h.map}){note}")
+            rows.append(f"{h.name} - {h.public_ip}:{h.port} (map={h.map}){note}")
+        self._fill_list(self.my_list, rows)
+
+    @staticmethod
+    def _fill_list(widget: QListWidget, rows: List[str]) -> None:
+        # One addItems() with updates/signals off instead of a relayout + repaint per row.
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        try:
+            widget.clear()
+            widget.addItems(rows)
+        finally:
+            widget.blockSignals(False)
+            widget.setUpdatesEnabled(True)
 
     # ---------- CRUD ----------
     def add_server(self):
@@ -309,12 +444,11 @@ class JacintoLobbyBrowser(QWidget):
         hosts = load_hosts()
         host = hosts[idx]
 
-        action, ok = QInputDialog.getText(self, "Edit or Remove", "Type 'edit' to edit fields, 'path' to change game path, or 'remove' to delete:")
+        action, ok = QInputDialog.getItem(self, "Edit or Remove", "Choose an action:", ["edit", "path", "remove"], 0, False)
         if not ok:
             return
-        action = action.strip().lower()
         if action == "remove":
-            del hosts[idx]
+            hosts.remove(host)
             save_hosts(hosts)
             self._refresh_mine()
             return
@@ -323,19 +457,15 @@ class JacintoLobbyBrowser(QWidget):
             if not exe:
                 return
             host.exe_path = exe
-            hosts[idx] = host
             save_hosts(hosts)
             self._refresh_mine()
             return
-        if action != "edit":
-            QMessageBox.information(self, "No Change", "Cancelled.")
-            return
 
         edited = Host.from_prompt()
         if not edited:
             return
         edited.id = host.id
-        hosts[idx] = edited
+        hosts[hosts.index(host)] = edited
         save_hosts(hosts)
         self._refresh_mine()
 
@@ -346,20 +476,15 @@ class JacintoLobbyBrowser(QWidget):
         exe = choose_exe_path("Set game EXE for this server")
         if not exe:
             return None
-        hosts = load_hosts()
-        for i, h in enumerate(hosts):
-            if h.id == host.id:
-                h.exe_path = exe
-                hosts[i] = h
-                break
-        save_hosts(hosts)
+        # host is the cached instance, so set the field in place and persist once.
+        host.exe_path = exe
+        save_hosts(load_hosts())
         return exe
 
     def launch_selected(self):
         idx = self.my_list.currentRow()
         if idx >= 0:
-            hosts = load_hosts()
-            cfg = hosts[idx]
+            cfg = load_hosts()[idx]
             exe = self._ensure_host_exe(cfg)
             if not exe:
                 QMessageBox.critical(self, "Error", "Executable is required for this server.")
@@ -368,8 +493,11 @@ class JacintoLobbyBrowser(QWidget):
             if ok and pw == cfg.password:
                 try:
                     subprocess.Popen([exe, "server", f"{cfg.map}.gear?game=koth?MaxPlayers=10?bots=6?", f"-port={cfg.port}", "-useallavailablecores", "-log"])  # noqa: E501
-                    time.sleep(10)
-                    subprocess.Popen([exe, f"{cfg.local_ip}:{cfg.port}"])
+                    threading.Thread(
+                        target=self._wait_for_server,
+                        args=(cfg.local_ip, cfg.port, [exe, f"{cfg.local_ip}:{cfg.port}"]),
+                        daemon=True,
+                    ).start()
                 except Exception as e:
                     QMessageBox.critical(self, "Launch Error", str(e))
             else:
@@ -379,13 +507,13 @@ class JacintoLobbyBrowser(QWidget):
                     QMessageBox.critical(self, "Launch Error", str(e))
             return
 
-        aidx = self.available_list.currentRow()
-        if aidx < 0:
+        aidx = self.available_list.currentIndex()
+        if not aidx.isValid():
             QMessageBox.information(self, "Select", "Select a server to launch/join.")
             return
-        text = self.available_list.currentItem().text()
+        server = self.available_model.server_at(aidx.row())
         try:
-            endpoint = text.split(" - ", 1)[1]
+            endpoint = f"{server['public_ip']}:{server['port']}"
         except Exception:
             QMessageBox.critical(self, "Parse Error", "Could not parse selected server endpoint.")
             return
@@ -397,67 +525,124 @@ class JacintoLobbyBrowser(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Launch Error", str(e))
 
+    def _wait_for_server(self, ip: str, port: int, client_args: List[str]):
+        # Runs off the GUI thread: launch the client as soon as the server accepts connections.
+        # Servers that only listen on UDP never accept, so fall back to launching at the deadline.
+        deadline = time.monotonic() + SERVER_BOOT_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((ip, port), timeout=0.2):
+                    break
+            except OSError:
+                time.sleep(0.3)
+        self.launch_client_signal.emit(client_args)
+
+    def _launch_client(self, args: List[str]):
+        try:
+            subprocess.Popen(args)
+        except Exception as e:
+            QMessageBox.critical(self, "Launch Error", str(e))
+
     # ---------- Heartbeat ----------
     def manual_start_heartbeat(self):
         idx = self.my_list.currentRow()
         if idx < 0:
             QMessageBox.information(self, "Select", "Select a server in 'My Servers' to heartbeat.")
             return
-        hosts = load_hosts()
-        host = hosts[idx]
-        if host.id in self.hb_threads and not self.hb_threads[host.id].is_set():
+        host = load_hosts()[idx]
+        if host.id in self._hb_active:
             QMessageBox.information(self, "Already Running", "Heartbeat already running for this server.")
             return
-        stop_event = threading.Event()
-        self.hb_threads[host.id] = stop_event
+        self._hb_active[host.id] = host
+        self._hb_failures[host.id] = 0
         self.hb_color_signal.emit("#ffaa00")
-        t = threading.Thread(target=self._hb_loop, args=(host, stop_event), daemon=True)
-        t.start()
+        self._send_heartbeat(host)
+        if not self._hb_timer.isActive():
+            self._hb_timer.start()
 
     def manual_stop_heartbeat(self):
-        any_running = False
-        for ev in list(self.hb_threads.values()):
-            if not ev.is_set():
-                ev.set(); any_running = True
-        self.hb_threads.clear()
+        any_running = bool(self._hb_active)
+        self._halt_heartbeats()
         if any_running:
             self.hb_color_signal.emit("red")
             QMessageBox.information(self, "Stopped", "All heartbeats stopped.")
         else:
             QMessageBox.information(self, "No Active Heartbeat", "No heartbeat is currently running.")
 
-    def _hb_loop(self, host: Host, stop_event: threading.Event):
-        failures = 0
-        while not stop_event.is_set():
-            try:
-                payload = {"name": host.name, "public_ip": host.public_ip, "port": int(host.port), "map": host.map}
-                r = requests.post(f"{BACKEND_URL}/add_server", json=payload, timeout=3)
-                if 200 <= r.status_code < 300:
-                    failures = 0
-                    self.hb_color_signal.emit("lime")
-                else:
-                    failures += 1
-            except Exception:
-                failures += 1
-            if failures >= 2:
+    def _hb_tick(self):
+        hosts = list(self._hb_active.values())
+        if not hosts:
+            return
+        if self._hb_bulk:
+            # One POST for every active host instead of one per host.
+            self._post_heartbeat("/add_servers", [self._hb_payload(h) for h in hosts], [h.id for h in hosts])
+        else:
+            for host in hosts:
+                self._send_heartbeat(host)
+
+    def _send_heartbeat(self, host: Host):
+        self._post_heartbeat("/add_server", self._hb_payload(host), [host.id])
+
+    @staticmethod
+    def _hb_payload(host: Host) -> dict:
+        return {"name": host.name, "public_ip": host.public_ip, "port": int(host.port), "map": host.map}
+
+    def _post_heartbeat(self, route: str, body, host_ids: List[str]):
+        # Async POST on Qt's event loop; every active host shares the one GUI thread, no workers.
+        req = QNetworkRequest(QUrl(f"{BACKEND_URL}{route}"))
+        req.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
+        if hasattr(req, "setTransferTimeout"):  # Qt >= 5.15
+            req.setTransferTimeout(3000)
+        reply = self._nam.post(req, json.dumps(body).encode("utf-8"))
+        self._hb_replies.add(reply)
+        reply.finished.connect(lambda: self._on_hb_reply(route, host_ids, reply))
+
+    def _halt_heartbeats(self):
+        # Stop is immediate: no further ticks, and in-flight posts are aborted so a late reply
+        # can't turn the LED back to lime after the user hit Stop.
+        self._hb_active.clear()
+        self._hb_failures.clear()
+        self._hb_timer.stop()
+        for reply in list(self._hb_replies):
+            reply.abort()
+
+    def _on_hb_reply(self, route: str, host_ids: List[str], reply: QNetworkReply):
+        self._hb_replies.discard(reply)
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) or 0
+        if route == "/add_servers" and status in (404, 405):
+            # Backend predates the bulk route: fall back to per-host posts from now on.
+            self._hb_bulk = False
+            for host_id in host_ids:
+                host = self._hb_active.get(host_id)
+                if host:
+                    self._send_heartbeat(host)
+            return
+        ok = reply.error() == QNetworkReply.NoError and 200 <= status < 300
+        for host_id in host_ids:
+            if host_id not in self._hb_active:
+                continue
+            if ok:
+                self._hb_failures[host_id] = 0
+                self.hb_color_signal.emit("lime")
+            else:
+                self._hb_failures[host_id] = self._hb_failures.get(host_id, 0) + 1
+            if self._hb_failures[host_id] >= 2:
                 self.hb_color_signal.emit("red")
-            stop_event.wait(HEARTBEAT_INTERVAL)
-
-    # ---------- Paint/close ----------
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        glow_color = QColor(255, 0, 0, 180)
-        for i in range(8, 0, -1):
-            glow_color.setAlpha(20 * i)
-            painter.setPen(QColor(glow_color))
-            painter.drawRoundedRect(self.rect().adjusted(i, i, -i, -i), 12, 12)
-        painter.setPen(QColor(255, 0, 0))
-        painter.drawRoundedRect(self.rect().adjusted(4, 4, -4, -4), 12, 12)
+
+    # ---------- Show/close ----------
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._refresh_pending:
+            self._refresh_available()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized() and self._refresh_pending:
+            self._refresh_available()
 
     def closeEvent(self, event):
-        for ev in self.hb_threads.values():
-            ev.set()
+        self._halt_heartbeats()
         try:
             pygame.mixer.stop()
         except Exception:
@@ -486,26 +671,33 @@ if __name__ == "__main__":
         if sfx and pygame.mixer.get_init():
             splash_channel = pygame.mixer.Channel(0)
             splash_channel.play(sfx)
-        loop = QEventLoop(); QTimer.singleShot(1500, loop.quit); loop.exec_()
 
-    win = JacintoLobbyBrowser()
-    win.show()
+    def start_main():
+        win.show()
+
+        if pygame.mixer.get_init():
+            bg = load_sound(OMEN_WAV)
+            if bg:
+                try:
+                    ch = pygame.mixer.Channel(1)
+                    ch.play(bg, loops=-1)
+                except Exception:
+                    pass
 
-    if pygame.mixer.get_init():
-        bg = load_sound(OMEN_WAV)
-        if bg:
+        if splash:
+            splash.finish(win)
             try:
-                ch = pygame.mixer.Channel(1)
-                ch.play(bg, loops=-1)
+                if splash_channel:
+                    splash_channel.stop()
             except Exception:
                 pass
 
+    # Arm the splash timer before building the window so construction overlaps the splash
+    # instead of being serialized after a blocking wait.
     if splash:
-        splash.finish(win)
-        try:
-            if splash_channel:
-                splash_channel.stop()
-        except Exception:
-            pass
+        QTimer.singleShot(1500, start_main)
+    win = JacintoLobbyBrowser()
+    if not splash:
+        start_main()
 
     sys.exit(app.exec_())
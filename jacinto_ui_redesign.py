@@ -3,30 +3,121 @@
 import sys
 import os
 import json
-import threading
 import time
 import requests
 import subprocess
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QPushButton, QMessageBox, QLineEdit,
     QLabel, QInputDialog, QMenuBar, QMenu, QSplashScreen, QFrame,
-    QGraphicsDropShadowEffect, QAction
+    QAction, QDialog, QDialogButtonBox, QFormLayout
 )
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor, QPainter
-from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEventLoop
+from PyQt5.QtCore import QTimer, Qt, QPropertyAnimation, QEventLoop, QUrl
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QTcpSocket
+from PyQt5.QtMultimedia import QSoundEffect
+
+try:
+    import orjson  # 2-10x faster than stdlib json; optional
+except ImportError:
+    orjson = None
 
 import pygame
 pygame.mixer.init()
 
 BACKEND_URL = "https://jacinto-server.fly.dev"
 HEARTBEAT_INTERVAL = 5
+HEARTBEAT_MAX_BACKOFF = 60  # seconds between heartbeats at most while the backend is failing
+SERVER_BOOT_TIMEOUT = 10  # seconds to wait for the local server before launching the client anyway
+STREAM_RETRY_MS = 30000
+STREAM_WATCHDOG_MS = 30000  # the backend sends a keep-alive every 10 s; this much silence means a dead link
+SERVERS_CACHE = "servers_cache.json"
+SERVERS_CACHE_MAX_AGE = 24 * 3600
 CONFIG_FILENAME = "owners.json"
+HOST_CONFIG_FILENAME = "host_config.json"
+OWNER_SERVER_NAME = "Caleb's Server"  # heartbeat LED goes lime while a listed server carries this name
+HTTP_TIMEOUT = (2, 4)  # (connect, read) seconds
+
+# Pooled keep-alive session so repeat calls to the backend skip the TCP + TLS handshake
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2)))
+
 OMEN_WAV = "return-of-the-omen-fixed.wav"
 MAD_WORLD_WAV = "mad-world-fixed.wav"
 COG_TAG_WAV = "gears-of-war-cog-tag-fixed.wav"
 
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _dumps(obj):
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+def _read_json(path):
+    # None when the file doesn't exist; parse errors propagate to the caller
+    p = Path(path)
+    return _loads(p.read_bytes()) if p.exists() else None
+
+def _write_json(path, obj):
+    Path(path).write_bytes(_dumps(obj))
+
+_SOUNDS = {}  # path -> pygame.mixer.Sound, so each WAV is read and decoded once per process
+
+def load_sound(path):
+    sound = _SOUNDS.get(path)
+    if sound is None:
+        sound = _SOUNDS[path] = pygame.mixer.Sound(path)
+    return sound
+
+class AddServerDialog(QDialog):
+    # All of the host fields in one modal form instead of six chained QInputDialogs
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Add Your Server")
+        self.name_edit = QLineEdit()
+        self.public_ip_edit = QLineEdit()
+        self.local_ip_edit = QLineEdit()
+        self.port_edit = QLineEdit()
+        self.map_edit = QLineEdit()
+        self.password_edit = QLineEdit()
+        self.password_edit.setEchoMode(QLineEdit.Password)
+
+        form = QFormLayout(self)
+        form.addRow("Server Name:", self.name_edit)
+        form.addRow("Public IP:", self.public_ip_edit)
+        form.addRow("Local IP:", self.local_ip_edit)
+        form.addRow("Port:", self.port_edit)
+        form.addRow("Map:", self.map_edit)
+        form.addRow("Host Password:", self.password_edit)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        form.addRow(buttons)
+
+    def accept(self):
+        if not all(edit.text().strip() for edit in (self.name_edit, self.public_ip_edit, self.local_ip_edit,
+                                                    self.port_edit, self.map_edit)) or not self.password_edit.text():
+            QMessageBox.critical(self, "Error", "All fields are required.")
+            return
+        if not self.port_edit.text().strip().isdigit():
+            QMessageBox.critical(self, "Error", "Port must be an integer.")
+            return
+        super().accept()
+
+    def values(self):
+        return {
+            "name": self.name_edit.text().strip(),
+            "public_ip": self.public_ip_edit.text().strip(),
+            "local_ip": self.local_ip_edit.text().strip(),
+            "port": int(self.port_edit.text().strip()),
+            "map": self.map_edit.text().strip(),
+            "password": self.password_edit.text(),
+        }
+
 class JacintoLobbyBrowser(QWidget):
     def __init__(self):
         super().__init__()
@@ -35,30 +126,44 @@ class JacintoLobbyBrowser(QWidget):
         self.setGeometry(200, 100, 800, 600)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.setStyleSheet(self.load_dark_theme())
-        self.heartbeat_threads = []
+        self.hb_timer = None
+        self.hb_payload = b""
+        self.glow_cache = None
+        self.is_resizing = False
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self.end_resize)
         self.server_path = self.load_owner_path()
+        self.host_cfg = self.load_host_cfg()
         self.is_muted = False
-
-        self.click_sound = pygame.mixer.Sound(COG_TAG_WAV)
-        self.click_sound.set_volume(0.3)
-        self.background_music = pygame.mixer.Sound(OMEN_WAV)
+        self.nam = QNetworkAccessManager(self)
+        self.server_stream = None
+        self.stream_buffer = b""
+        self.stream_watchdog = QTimer(self)
+        self.stream_watchdog.setSingleShot(True)
+        self.stream_watchdog.timeout.connect(self.on_stream_silent)
+        self.stream_live = False
+        self.server_rows = []
+        self.servers_etag = None
+        self.owner_listed = False
+
+        # UI blips go through Qt's low-latency QSoundEffect; pygame only plays the music
+        self.click_sound = QSoundEffect(self)
+        self.click_sound.setSource(QUrl.fromLocalFile(os.path.abspath(COG_TAG_WAV)))
+        self.click_sound.setVolume(0.3)
+        self.background_music = load_sound(OMEN_WAV)
         self.background_music.set_volume(0.2)
         self.bg_channel = pygame.mixer.Channel(1)
-        self.fx_channel = pygame.mixer.Channel(2)
 
         self.setup_ui()
+        self.load_servers_cache(SERVERS_CACHE_MAX_AGE)
         self.ask_if_host()
+        self.open_server_stream()
         self.refresh_loop()
 
     def play_click(self):
-        if self.is_muted:
-            return
-        if self.bg_channel.get_busy():
-            self.bg_channel.pause()
-        self.fx_channel.play(self.click_sound)
-        while self.fx_channel.get_busy():
-            pygame.time.wait(10)
-        self.bg_channel.unpause()
+        if not self.is_muted:
+            self.click_sound.play()
 
     def start_background_music(self):
         if not self.is_muted:
@@ -69,7 +174,21 @@ class JacintoLobbyBrowser(QWidget):
         pygame.mixer.pause() if self.is_muted else pygame.mixer.unpause()
 
     def paintEvent(self, event):
-        painter = QPainter(self)
+        if self.is_resizing:
+            # Mid drag-resize: just the solid border; the glow comes back once resizing settles
+            painter = QPainter(self)
+            painter.setPen(QColor(255, 0, 0))
+            painter.drawRoundedRect(self.rect().adjusted(4, 4, -4, -4), 12, 12)
+            return
+        if self.glow_cache is None or self.glow_cache.size() != self.size():
+            self.glow_cache = self.render_glow()
+        QPainter(self).drawPixmap(0, 0, self.glow_cache)
+
+    def render_glow(self):
+        # The glow border only depends on the window size, so it is drawn once into a pixmap
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         glow_color = QColor(255, 0, 0, 180)
         for i in range(8, 0, -1):
@@ -78,12 +197,25 @@ class JacintoLobbyBrowser(QWidget):
             painter.drawRoundedRect(self.rect().adjusted(i, i, -i, -i), 12, 12)
         painter.setPen(QColor(255, 0, 0))
         painter.drawRoundedRect(self.rect().adjusted(4, 4, -4, -4), 12, 12)
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        self.glow_cache = None
+        self.is_resizing = True
+        self.resize_timer.start(100)
+        super().resizeEvent(event)
+
+    def end_resize(self):
+        self.is_resizing = False
+        self.update()
 
     def load_dark_theme(self):
         return """
         QWidget { background-color: rgba(18,18,18,200); color: #e0e0e0; font-family: Segoe UI; font-size: 14px; }
-        QPushButton { background-color: #2a2a2a; border: 1px solid #3e3e3e; padding: 8px; border-radius: 6px; color: white; }
-        QPushButton:hover { background-color: #3a3a3a; border: 1px solid #ff0000; }
+        QPushButton { background-color: #2a2a2a; border: 2px solid rgba(255,0,0,60); padding: 8px; border-radius: 6px; color: white; }
+        QPushButton:hover { background-color: #3a3a3a; border: 2px solid rgba(255,0,0,200); }
+        QPushButton:pressed { background-color: #222222; border: 2px solid #ff0000; }
         QLineEdit, QLabel { border: 1px solid #3e3e3e; border-radius: 4px; padding: 6px; background-color: #1e1e1e; }
         QListWidget { background: transparent; border: 1px solid #444; border-radius: 6px; }
         QMenuBar { background-color: #1e1e1e; }
@@ -91,13 +223,6 @@ class JacintoLobbyBrowser(QWidget):
         QMenu { background-color: #1e1e1e; }
         """
 
-    def add_glow(self, button: QPushButton):
-        glow = QGraphicsDropShadowEffect()
-        glow.setBlurRadius(20)
-        glow.setOffset(0)
-        glow.setColor(QColor(255, 0, 0, 160))
-        button.setGraphicsEffect(glow)
-
     def setup_ui(self):
         layout = QVBoxLayout(self)
         self.setLayout(layout)
@@ -128,7 +253,6 @@ class JacintoLobbyBrowser(QWidget):
         self.launch_btn = QPushButton("Launch Selected")
 
         for btn in [self.add_btn, self.edit_btn, self.launch_btn]:
-            self.add_glow(btn)
             btn.clicked.connect(self.play_click)
 
         self.add_btn.clicked.connect(self.add_server)
@@ -148,38 +272,130 @@ class JacintoLobbyBrowser(QWidget):
         hb_frame.addWidget(self.hb_status)
         layout.addLayout(hb_frame)
 
-        self.hb_timer = QTimer(self)
-        self.hb_timer.timeout.connect(self.check_heartbeat_status)
-        self.hb_timer.start(3000)
-
     def set_hb_color(self, color):
         self.hb_status.setStyleSheet(f"background-color: {color}; border-radius: 10px;")
 
-    def check_heartbeat_status(self):
-        try:
-            r = requests.get(f"{BACKEND_URL}/servers", timeout=2)
-            servers = r.json()
-            found = any("Caleb's Server" in s.get("name", "") for s in servers)
-            self.set_hb_color("lime" if found else "red")
-        except:
-            self.set_hb_color("red")
+    def get_servers_async(self, slot):
+        # Non-blocking GET on Qt's event loop; slot(reply) runs when it finishes
+        req = QNetworkRequest(QUrl(f"{BACKEND_URL}/servers"))
+        if hasattr(req, "setTransferTimeout"):  # Qt >= 5.15
+            req.setTransferTimeout(3000)
+        if self.servers_etag:
+            req.setRawHeader(b"If-None-Match", self.servers_etag)
+        reply = self.nam.get(req)
+        reply.finished.connect(lambda: slot(reply))
 
     def refresh_loop(self):
-        self.update_server_list()
-        QTimer.singleShot(5000, self.refresh_loop)
+        # Polling is only the fallback while the push stream is down. One /servers fetch feeds both
+        # the list and the heartbeat LED; the next tick is scheduled once this one has landed
+        if self.stream_live:
+            QTimer.singleShot(5000, self.refresh_loop)
+            return
+        self.get_servers_async(self.update_server_list)
 
-    def update_server_list(self):
+    def update_server_list(self, reply):
         try:
-            res = requests.get(f"{BACKEND_URL}/servers")
-            self.server_list.clear()
-            for s in res.json():
-                self.server_list.addItem(f"{s['name']} - {s['public_ip']}:{s['port']}")
+            if reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) == 304:
+                # Unchanged since our last copy, but the LED may still be red from a failed poll
+                self.set_hb_color("lime" if self.owner_listed else "red")
+                return
+            if reply.error() != QNetworkReply.NoError:
+                raise RuntimeError(reply.errorString())
+            raw = bytes(reply.readAll())
+            self.apply_servers(_loads(raw))
+            self.save_servers_cache(raw)
+            self.servers_etag = bytes(reply.rawHeader(b"ETag")) or None
         except Exception as e:
             print("[Server List Error]", e)
+            self.set_hb_color("red")
+            if self.server_list.count() == 0:
+                self.load_servers_cache()
+        finally:
+            reply.deleteLater()
+            QTimer.singleShot(5000, self.refresh_loop)
+
+    def apply_servers(self, servers, from_cache=False):
+        found = False
+        rows = []
+        for s in servers:
+            name = s["name"]
+            rows.append(f"{name} - {s['public_ip']}:{s['port']}")
+            found = found or OWNER_SERVER_NAME in name
+        # Rebuild only when the rows actually changed, and then in one addItems() with updates off
+        if rows != self.server_rows:
+            self.server_list.setUpdatesEnabled(False)
+            self.server_list.clear()
+            self.server_list.addItems(rows)
+            self.server_list.setUpdatesEnabled(True)
+            self.server_rows = rows
+        if not from_cache:
+            self.owner_listed = found
+            self.set_hb_color("lime" if found else "red")
+
+    def save_servers_cache(self, raw):
+        # Last known good /servers payload, so the list still populates when the backend is down
+        try:
+            Path(SERVERS_CACHE).write_bytes(raw)
+        except OSError as e:
+            print("[Server Cache Error]", e)
+
+    def load_servers_cache(self, max_age=None):
+        if max_age is not None and os.path.exists(SERVERS_CACHE) and time.time() - os.path.getmtime(SERVERS_CACHE) > max_age:
+            return
+        try:
+            servers = _read_json(SERVERS_CACHE)
+            if servers is not None:
+                self.apply_servers(servers, from_cache=True)
+        except Exception as e:
+            print("[Server Cache Error]", e)
+
+    def open_server_stream(self):
+        # Subscribe to /servers/stream (server-sent events); the backend pushes a fresh list only
+        # when it changes, so a quiet lobby costs no traffic
+        req = QNetworkRequest(QUrl(f"{BACKEND_URL}/servers/stream"))
+        req.setRawHeader(b"Accept", b"text/event-stream")
+        self.stream_buffer = b""
+        self.server_stream = self.nam.get(req)
+        self.server_stream.readyRead.connect(self.on_stream_data)
+        self.server_stream.finished.connect(self.on_stream_closed)
+        self.stream_watchdog.start(STREAM_WATCHDOG_MS)
+
+    def on_stream_data(self):
+        reply = self.server_stream
+        self.stream_watchdog.start(STREAM_WATCHDOG_MS)  # any bytes, keep-alives included, prove the link is up
+        if reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) != 200:
+            return
+        self.stream_buffer += bytes(reply.readAll()).replace(b"\r\n", b"\n")
+        while b"\n\n" in self.stream_buffer:
+            frame, self.stream_buffer = self.stream_buffer.split(b"\n\n", 1)
+            data = b"\n".join(line[5:].strip() for line in frame.split(b"\n") if line.startswith(b"data:"))
+            if not data:
+                continue  # keep-alive comment
+            try:
+                self.apply_servers(_loads(data))
+            except Exception as e:
+                print("[Server Stream Error]", e)
+                continue
+            self.stream_live = True
+            self.save_servers_cache(data)
+
+    def on_stream_silent(self):
+        # A half-open connection never emits finished; abort() does, which hands over to polling
+        if self.server_stream is not None:
+            print("[Server Stream Error] no data for", STREAM_WATCHDOG_MS // 1000, "s, reconnecting")
+            self.server_stream.abort()
+
+    def on_stream_closed(self):
+        # Dropped, or a backend without /servers/stream: polling takes over until we reconnect
+        self.stream_live = False
+        self.stream_watchdog.stop()
+        self.server_stream.deleteLater()
+        self.server_stream = None
+        QTimer.singleShot(STREAM_RETRY_MS, self.open_server_stream)
 
     def get_public_ip(self):
         try:
-            return requests.get("https://api.ipify.org").text
+            return SESSION.get("https://api.ipify.org", timeout=HTTP_TIMEOUT).text
         except:
             return "0.0.0.0"
 
@@ -188,115 +404,162 @@ class JacintoLobbyBrowser(QWidget):
         if reply == QMessageBox.Yes:
             pw, ok = QInputDialog.getText(self, "Password", "Enter host password:", echo=QLineEdit.Password)
             if ok and pw == "1207706":
-                if os.path.exists("host_config.json"):
-                    with open("host_config.json") as f:
-                        cfg = json.load(f)
-                    self.launch_heartbeat(cfg["name"], cfg["public_ip"], cfg["port"], cfg["map"])
+                if self.host_cfg:
+                    self.launch_heartbeat(self.host_cfg)
 
     def add_server(self):
-        name, ok1 = QInputDialog.getText(self, "Server Name", "Enter your server name:")
-        public_ip, ok2 = QInputDialog.getText(self, "Public IP", "Enter your public IP:")
-        local_ip, ok3 = QInputDialog.getText(self, "Local IP", "Enter your local IP:")
-        port, ok4 = QInputDialog.getText(self, "Port", "Enter your server port:")
-        map_name, ok5 = QInputDialog.getText(self, "Map", "Enter map name:")
-        pw, ok6 = QInputDialog.getText(self, "Password", "Set a host password:", echo=QLineEdit.Password)
-
-        if not all([ok1, name, ok2, public_ip, ok3, local_ip, ok4, port, ok5, map_name, ok6, pw]):
-            QMessageBox.critical(self, "Error", "All fields are required.")
+        dlg = AddServerDialog(self)
+        if dlg.exec_() != QDialog.Accepted:
             return
 
-        config = {"name": name, "public_ip": public_ip, "local_ip": local_ip, "port": int(port), "map": map_name, "password": pw}
-        with open("host_config.json", "w") as f:
-            json.dump(config, f)
-
-        self.launch_heartbeat(name, public_ip, port, map_name)
-
-    def launch_heartbeat(self, name, ip, port, map_name):
-        stop_event = threading.Event()
-        thread = threading.Thread(target=self.send_heartbeat, args=(stop_event, name, ip, port, map_name), daemon=True)
-        thread.start()
-        self.heartbeat_threads.append(stop_event)
-
-    def send_heartbeat(self, stop_event, name, ip, port, map_name):
-        while not stop_event.is_set():
-            try:
-                data = {"name": name, "public_ip": ip, "port": int(port), "map": map_name}
-                res = requests.post(f"{BACKEND_URL}/add_server", json=data)
-                print(f"[Heartbeat] Sent: {res.status_code} - {res.text}")
-            except Exception as e:
-                print("[Heartbeat Error]", e)
-            stop_event.wait(HEARTBEAT_INTERVAL)
+        config = dlg.values()
+        _write_json(HOST_CONFIG_FILENAME, config)
+        self.host_cfg = config
+
+        self.launch_heartbeat(config)
+
+    def launch_heartbeat(self, cfg):
+        # One GUI-thread QTimer posting through the shared QNetworkAccessManager; starting again
+        # replaces the running heartbeat instead of stacking another one
+        data = {"name": cfg["name"], "public_ip": cfg["public_ip"], "port": int(cfg["port"]), "map": cfg["map"]}
+        self.hb_payload = _dumps(data)
+        if self.hb_timer is None:
+            self.hb_timer = QTimer(self)
+            self.hb_timer.timeout.connect(self.send_heartbeat)
+        self.hb_timer.start(HEARTBEAT_INTERVAL * 1000)
+        self.send_heartbeat()
+
+    def send_heartbeat(self):
+        req = QNetworkRequest(QUrl(f"{BACKEND_URL}/add_server"))
+        req.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
+        if hasattr(req, "setTransferTimeout"):  # Qt >= 5.15
+            req.setTransferTimeout(4000)
+        reply = self.nam.post(req, self.hb_payload)
+        reply.finished.connect(lambda: self.on_heartbeat_reply(reply))
+
+    def on_heartbeat_reply(self, reply):
+        # Exponential backoff while the backend is unreachable or failing, reset on the first success
+        if reply.error() == QNetworkReply.NoError:
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            print(f"[Heartbeat] Sent: {status} - {bytes(reply.readAll()).decode('utf-8', 'replace')}")
+            interval = HEARTBEAT_INTERVAL * 1000
+        else:
+            print("[Heartbeat Error]", reply.errorString())
+            interval = min(self.hb_timer.interval() * 2, HEARTBEAT_MAX_BACKOFF * 1000)
+        if self.hb_timer.interval() != interval:
+            self.hb_timer.setInterval(interval)
+        reply.deleteLater()
 
     def remove_server(self):
-        if not os.path.exists("host_config.json"):
+        if not os.path.exists(HOST_CONFIG_FILENAME):
             QMessageBox.information(self, "Info", "No server configuration found.")
             return
-        os.remove("host_config.json")
+        os.remove(HOST_CONFIG_FILENAME)
+        self.host_cfg = None
         QMessageBox.information(self, "Removed", "Server configuration removed.")
 
     def launch_server(self):
-        if not os.path.exists(CONFIG_FILENAME):
+        owner = _read_json(CONFIG_FILENAME)
+        if owner is None:
             path, ok = QInputDialog.getText(self, "Executable Path", "Enter Jacinto 1.2 path:")
             if not ok or not os.path.exists(path):
                 QMessageBox.critical(self, "Error", "Executable not found.")
                 return
-            json.dump({"exe_path": path}, open(CONFIG_FILENAME, "w"))
+            owner = {"exe_path": path}
+            _write_json(CONFIG_FILENAME, owner)
 
-        with open(CONFIG_FILENAME, "r") as f:
-            exe_path = json.load(f)["exe_path"]
+        exe_path = owner["exe_path"]
 
-        if not os.path.exists("host_config.json"):
+        cfg = self.host_cfg
+        if not cfg:
             QMessageBox.critical(self, "Error", "No host config. Use Add Your Server.")
             return
 
-        with open("host_config.json", "r") as f:
-            cfg = json.load(f)
-
         pw, ok = QInputDialog.getText(self, "Join Password", "Enter host password (blank guest):", echo=QLineEdit.Password)
 
         if ok and pw == cfg["password"]:
             args = [exe_path, "server", f"{cfg['map']}.gear?game=koth?MaxPlayers=10?bots=6?", f"-port={cfg['port']}", "-useallavailablecores", "-log"]
             try:
                 subprocess.Popen(args)
-                time.sleep(10)
-                subprocess.Popen([exe_path, f"{cfg['local_ip']}:{cfg['port']}"])
             except Exception as e:
                 QMessageBox.critical(self, "Launch Error", str(e))
+                return
+            self.launch_client_when_ready(exe_path, cfg["local_ip"], int(cfg["port"]))
         else:
             try:
                 subprocess.Popen([exe_path, f"{cfg['public_ip']}:{cfg['port']}"])
             except Exception as e:
                 QMessageBox.critical(self, "Launch Error", str(e))
 
+    def launch_client_when_ready(self, exe_path, ip, port):
+        # Probe the server with a non-blocking QTcpSocket, retrying every 500 ms, instead of sleeping
+        # on the GUI thread. A server that only listens on UDP never accepts, so the client is
+        # launched at the deadline anyway
+        probe = QTcpSocket(self)
+        retry = QTimer(self)
+        retry.setSingleShot(True)
+        give_up = QTimer(self)
+        give_up.setSingleShot(True)
+        launched = False
+
+        def attempt():
+            probe.abort()
+            probe.connectToHost(ip, port)
+
+        def launch():
+            nonlocal launched
+            if launched:
+                return
+            launched = True
+            retry.stop()
+            give_up.stop()
+            probe.abort()
+            for obj in (probe, retry, give_up):
+                obj.deleteLater()
+            try:
+                subprocess.Popen([exe_path, f"{ip}:{port}"])
+            except Exception as e:
+                QMessageBox.critical(self, "Launch Error", str(e))
+
+        probe.connected.connect(launch)
+        getattr(probe, "errorOccurred", probe.error).connect(lambda _err: retry.start(500))  # Qt >= 5.15
+        retry.timeout.connect(attempt)
+        give_up.timeout.connect(launch)
+        give_up.start(SERVER_BOOT_TIMEOUT * 1000)
+        attempt()
+
     def manual_start_heartbeat(self):
-        if not os.path.exists("host_config.json"):
+        if not self.host_cfg:
             QMessageBox.critical(self, "Error", "No host config found. Use 'Add Your Server' first.")
             return
 
-        with open("host_config.json", "r") as f:
-            cfg = json.load(f)
-        self.launch_heartbeat(cfg["name"], cfg["public_ip"], cfg["port"], cfg["map"])
+        self.launch_heartbeat(self.host_cfg)
 
     def manual_stop_heartbeat(self):
-        if self.heartbeat_threads:
-            for stop_event in self.heartbeat_threads:
-                stop_event.set()
-            self.heartbeat_threads.clear()
+        if self.hb_timer is not None and self.hb_timer.isActive():
+            self.hb_timer.stop()
             QMessageBox.information(self, "Stopped", "Heartbeat has been stopped.")
         else:
             QMessageBox.information(self, "No Active Heartbeat", "No heartbeat is currently running.")
 
+    def load_host_cfg(self):
+        # Read once at startup; add_server/remove_server keep self.host_cfg in sync afterwards
+        try:
+            return _read_json(HOST_CONFIG_FILENAME)
+        except (OSError, ValueError) as e:
+            print("[Host Config Error]", e)
+            return None
+
     def load_owner_path(self):
-        if os.path.exists(CONFIG_FILENAME):
-            try:
-                with open(CONFIG_FILENAME, "r") as f:
-                    return json.load(f).get("exe_path")
-            except:
-                return None
+        try:
+            owner = _read_json(CONFIG_FILENAME)
+        except:
+            return None
+        return owner.get("exe_path") if owner else None
 
     def closeEvent(self, event):
-        for stop_event in self.heartbeat_threads:
-            stop_event.set()
+        if self.hb_timer is not None:
+            self.hb_timer.stop()
         pygame.mixer.music.stop()
         event.accept()
 
@@ -313,7 +576,7 @@ if __name__ == "__main__":
 
         try:
             splash_channel = pygame.mixer.Channel(0)
-            splash_sound = pygame.mixer.Sound(MAD_WORLD_WAV)
+            splash_sound = load_sound(MAD_WORLD_WAV)
             splash_channel.play(splash_sound)
         except Exception as e:
             print("[Splash Sound Error]", e)
@@ -1,39 +1,141 @@
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+import hashlib
+import json
+import threading
 import time
 
+try:
+    import orjson  # faster serialization for the hot /servers paths; stdlib json otherwise
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
-servers = []  # In-memory server list
+servers = {}  # In-memory servers keyed by (public_ip, port)
+servers_changed = threading.Condition()  # guards `servers`; notified whenever the visible list changes
+servers_etag = hashlib.blake2b(b"", digest_size=8).hexdigest()  # hash of what clients see (no last_seen)
+
+REQUIRED_FIELDS = ["name", "public_ip", "port", "map"]
+STALE_AFTER = 60  # seconds without a heartbeat before a server is dropped
+SWEEP_INTERVAL = 10
+
+def _upsert_server(data):
+    with servers_changed:
+        if _upsert_server_locked(data):
+            _servers_mutated_locked()
+
+def _upsert_server_locked(data):
+    # Update or add the server: one hash lookup instead of a scan over every server.
+    # Returns whether anything other than last_seen changed.
+    key = (data["public_ip"], int(data["port"]))
+    entry = servers.get(key)
+    if entry:
+        changed = any(entry.get(k) != v for k, v in data.items())
+        entry.update(data)
+        entry["last_seen"] = time.time()
+        return changed
+    data["last_seen"] = time.time()
+    servers[key] = data
+    return True
+
+def _servers_mutated_locked():
+    # Recompute the ETag and wake /servers/stream subscribers; caller holds servers_changed
+    global servers_etag
+    visible = sorted(json.dumps({k: v for k, v in s.items() if k != "last_seen"}, sort_keys=True) for s in servers.values())
+    servers_etag = hashlib.blake2b("\n".join(visible).encode("utf-8"), digest_size=8).hexdigest()
+    servers_changed.notify_all()
+
+def _fresh_servers():
+    # The sweeper keeps `servers` down to recently seen entries, so reads are a plain copy.
+    # Returns (servers, etag) taken under the same lock so they always agree.
+    with servers_changed:
+        return [dict(s) for s in servers.values()], servers_etag
+
+def _sweep_stale_servers():
+    # Evict servers not seen for STALE_AFTER seconds, every SWEEP_INTERVAL, off the request path
+    while True:
+        time.sleep(SWEEP_INTERVAL)
+        now = time.time()
+        with servers_changed:
+            stale = [k for k, s in servers.items() if now - s["last_seen"] >= STALE_AFTER]
+            for key in stale:
+                servers.pop(key, None)
+            if stale:
+                _servers_mutated_locked()
+
+threading.Thread(target=_sweep_stale_servers, name="stale-server-sweeper", daemon=True).start()
+
+def _dumps(obj):
+    return orjson.dumps(obj).decode("utf-8") if orjson else json.dumps(obj)
+
+def _valid_port(port):
+    try:
+        int(port)
+    except (TypeError, ValueError):
+        return False
+    return True
 
 @app.route("/add_server", methods=["POST"])
 def add_server():
     data = request.get_json()
 
-    required_fields = ["name", "public_ip", "port", "map"]
-    if not all(field in data for field in required_fields):
+    if not all(field in data for field in REQUIRED_FIELDS):
         return jsonify({"error": "Missing required server fields"}), 400
+    if not _valid_port(data["port"]):
+        return jsonify({"error": "Port must be an integer"}), 400
 
-    # Update or add the server in the list
-    server_exists = False
-    for s in servers:
-        if s["public_ip"] == data["public_ip"] and s["port"] == data["port"]:
-            s.update(data)
-            s["last_seen"] = time.time()
-            server_exists = True
-            break
+    _upsert_server(data)
+    return jsonify({"status": "Server registered/updated"}), 200
 
-    if not server_exists:
-        data["last_seen"] = time.time()
-        servers.append(data)
+@app.route("/add_servers", methods=["POST"])
+def add_servers():
+    # Bulk heartbeat: one POST carrying every server a client is hosting
+    items = request.get_json()
 
-    return jsonify({"status": "Server registered/updated"}), 200
+    if not isinstance(items, list) or not all(
+        isinstance(d, dict) and all(field in d for field in REQUIRED_FIELDS) and _valid_port(d["port"])
+        for d in items
+    ):
+        return jsonify({"error": "Expected a list of servers with all required fields"}), 400
+
+    for data in items:
+        _upsert_server(data)
+    return jsonify({"status": f"{len(items)} servers registered/updated"}), 200
 
 @app.route("/servers", methods=["GET"])
 def get_servers():
-    # Return only servers seen in the last 60 seconds
-    now = time.time()
-    fresh_servers = [s for s in servers if now - s.get("last_seen", 0) < 60]
-    return jsonify(fresh_servers)
+    # Weak ETag: a 304 means the same servers, even though their last_seen values have moved on
+    with servers_changed:
+        etag = servers_etag
+    if request.if_none_match.contains_weak(etag):
+        resp = Response(status=304)
+    else:
+        fresh, etag = _fresh_servers()
+        resp = Response(_dumps(fresh), mimetype="application/json")
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "max-age=2"
+    return resp
+
+@app.route("/servers/stream", methods=["GET"])
+def stream_servers():
+    # Server-sent events: push the fresh list only when what clients would display changes.
+    # The ETag ignores last_seen, so routine heartbeats don't trigger a push.
+    def events():
+        last = None
+        while True:
+            # Check and wait under one lock hold so a notify_all() between the two can't be missed;
+            # a 10 s timeout with nothing new becomes a keep-alive
+            with servers_changed:
+                servers_changed.wait_for(lambda: servers_etag != last, timeout=10)
+                fresh, etag = _fresh_servers()
+            if etag != last:
+                last = etag
+                yield f"data: {_dumps(fresh)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(stream_with_context(events()), mimetype="text/event-stream", headers=headers)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=1000)